@@ -1,24 +1,87 @@
-from verifier import verify_email
-import time
-
-def generate_person_patterns(first, last, domain):
-    f, l = first.lower().strip(), last.lower().strip()
-    patterns = [
-        f"{f}@{domain}",
-        f"{l}@{domain}",
-        f"{f}{l}@{domain}",
-        f"{f}.{l}@{domain}",
-        f"{f}_{l}@{domain}",
-        f"{f}-{l}@{domain}",
-        f"{f[0]}{l}@{domain}",
-        f"{f[0]}.{l}@{domain}",
-        f"{l}{f[0]}@{domain}",
-        f"{l}.{f[0]}@{domain}",
-        f"{f}{l[0]}@{domain}",
-        f"{f}.{l[0]}@{domain}",
-        f"{f[0]}{l[0]}@{domain}"
-    ]
-    return list(dict.fromkeys(patterns))  # dedup
+from verifier import verify_domain_candidates
+from itertools import chain
+import re
+
+_DOMAIN_RE = re.compile(r"^[A-Za-z0-9.-]+\.[A-Za-z]{2,}$")
+
+# strips digits, punctuation and whitespace in one C-level pass — cheaper
+# than a per-character regex sub on this per-request path
+_NON_ALPHA_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(256) if not chr(c).isalpha()
+))
+
+def _clean_name(name):
+    return name.strip().lower().translate(_NON_ALPHA_TABLE)
+
+# Format specs for the 13 person patterns, built once at import and ordered
+# by empirical hit rate so the short-circuit search exits early on the
+# common formats. f=first, l=last, fi/li=initials, d=domain.
+_PATTERN_FMTS = (
+    "{f}.{l}@{d}",
+    "{f}@{d}",
+    "{f}{l}@{d}",
+    "{f}_{l}@{d}",
+    "{fi}.{l}@{d}",
+    "{f}{li}@{d}",
+    "{fi}{l}@{d}",
+    "{l}@{d}",
+    "{f}.{li}@{d}",
+    "{f}-{l}@{d}",
+    "{l}.{fi}@{d}",
+    "{l}{fi}@{d}",
+    "{fi}{li}@{d}"
+)
+
+def generate_person_patterns(first, last, domain, priority=None):
+    """Candidates in most-likely-first order; pass `priority` (an iterable
+    of format specs like "{f}.{l}@{d}") to try known formats first."""
+    f, l = _clean_name(first), _clean_name(last)
+    if not f or not l:
+        return []
+    ctx = {"f": f, "l": l, "fi": f[0], "li": l[0], "d": domain}
+    fmts = tuple(priority) + _PATTERN_FMTS if priority else _PATTERN_FMTS
+    return list(dict.fromkeys(fmt.format_map(ctx) for fmt in fmts))  # dedup
+
+
+class DebugCols:
+    """Columnar debug accumulator: one list per field instead of one dict
+    per candidate. Rows are materialized into dicts only when the JSON
+    response is built, so the hot loop never pays per-candidate dict
+    overhead (and the payload stays lean — no raw probe sequences)."""
+    __slots__ = ("emails", "statuses", "codes", "latencies", "deliverable", "catch_all", "reasons", "mx")
+
+    def __init__(self):
+        self.emails = []
+        self.statuses = []
+        self.codes = []
+        self.latencies = []
+        self.deliverable = []
+        self.catch_all = []
+        self.reasons = []
+        self.mx = []
+
+    def add(self, res):
+        analysis = res["smtp"].get("analysis", {})
+        self.emails.append(res["email"])
+        self.statuses.append(res["status"])
+        self.codes.append(analysis.get("real_code"))
+        self.latencies.append(analysis.get("avg_latency"))
+        self.deliverable.append(res["deliverable"])
+        self.catch_all.append(res["details"].get("is_catch_all"))
+        self.reasons.append(res["details"].get("reasoning"))
+        self.mx.append(res.get("mx_provider"))
+
+    def as_dicts(self):
+        return [
+            {
+                "email": e, "status": s, "code": c, "latency": t,
+                "deliverable": dv, "is_catch_all": ca, "reason": r, "mx_provider": m
+            }
+            for e, s, c, t, dv, ca, r, m in zip(
+                self.emails, self.statuses, self.codes, self.latencies,
+                self.deliverable, self.catch_all, self.reasons, self.mx
+            )
+        ]
 
 
 def generate_generic_patterns(domain):
@@ -27,12 +90,27 @@ def generate_generic_patterns(domain):
 
 
 def find_valid_email(first, last, domain):
-    all_candidates = generate_person_patterns(first, last, domain) + generate_generic_patterns(domain)
-    debug_log = []
+    if not _DOMAIN_RE.match(domain or ""):
+        return {
+            "status": "not_found",
+            "valid": False,
+            "email": None,
+            "reason": "bad_domain",
+            "debug": []
+        }
 
-    for email in all_candidates:
-        res = verify_email(email)
-        debug_log.append(res)
+    all_candidates = list(dict.fromkeys(chain(
+        generate_person_patterns(first, last, domain),
+        generate_generic_patterns(domain)
+    )))
+
+    # One session, one catch-all check, one RCPT per candidate
+    results = verify_domain_candidates(domain, all_candidates)
+
+    debug = DebugCols()
+    for res in results:
+        email = res["email"]
+        debug.add(res)
         print(f"🔍 Testing {email} → {res['status']} | catch_all={res['details'].get('is_catch_all')}")
 
         if res["deliverable"] and not res["details"].get("is_catch_all"):
@@ -43,15 +121,13 @@ def find_valid_email(first, last, domain):
                 "email": email,
                 "mx_provider": res.get("mx_provider"),
                 "reason": res["details"].get("reasoning"),
-                "debug": debug_log
+                "debug": debug.as_dicts()
             }
 
-        time.sleep(0.2)  # Prevent SMTP flood
-
     # If nothing found
     return {
         "status": "not_found",
         "valid": False,
         "email": None,
-        "debug": debug_log
+        "debug": debug.as_dicts()
     }
@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from finder import find_valid_email
 
@@ -41,7 +42,10 @@ async def find_email(req: FinderRequest):
     """
 
     try:
-        result = find_valid_email(req.first_name, req.last_name, req.domain)
+        # find_valid_email blocks on DNS + SMTP; keep it off the event loop
+        result = await run_in_threadpool(
+            find_valid_email, req.first_name, req.last_name, req.domain
+        )
 
         # Always return full debug info to inspect latency, codes, MX, etc.
         return {
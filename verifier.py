@@ -1,5 +1,6 @@
-import re, dns.resolver, smtplib, time, random, string, logging
-from statistics import mean
+import re, dns.resolver, smtplib, time, secrets, logging, threading, asyncio, copy
+import aiodns
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # =========================
@@ -7,8 +8,16 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 # =========================
 EMAIL_REGEX = re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$")
 TIMEOUT = 5
-PAUSE_BETWEEN_PROBES = 0.1
+PAUSE_BETWEEN_PROBES = 0.02   # only for non-definitive replies; see adaptive_pause
+PIPELINING_NO_PAUSE = True    # pipelined batches never pause between RCPTs
+THROTTLE_BACKOFF_BASE = 0.5
+THROTTLE_BACKOFF_MAX = 5.0
 MAX_WORKERS_DEFAULT = 20
+MX_CACHE_TTL_MIN = 60
+MX_CACHE_TTL_MAX = 3600
+SESSION_TTL = 100
+RESULT_CACHE_TTL = 24 * 3600
+RESULT_CACHE_MAX = 10000
 
 FREE_PROVIDERS = {
     "gmail.com","yahoo.com","outlook.com","hotmail.com",
@@ -19,96 +28,408 @@ DISPOSABLE_PROVIDERS = {
 }
 ROLE_PREFIXES = {"info","admin","sales","support","contact","hr","help","team"}
 
+# str.endswith/startswith take a tuple natively — one C call instead of
+# a Python-level any() loop over the set
+_DISPOSABLE_TUPLE = tuple(DISPOSABLE_PROVIDERS)
+_ROLE_TUPLE = tuple(ROLE_PREFIXES)
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 
 # =========================
 # UTILITIES
 # =========================
 def random_local(k=8):
-    return ''.join(random.choices(string.ascii_lowercase + string.digits, k=k))
+    return secrets.token_hex((k + 1) // 2)[:k]
+
+_FAKES: dict = {}   # domain -> two canonical fake addresses for catch-all checks
+
+def _fakes_for(domain:str):
+    return _FAKES.setdefault(domain, (
+        f"{random_local()}@{domain}",
+        f"{random_local()}@{domain}"
+    ))
+
+_PROVIDER_RE = re.compile(
+    r"outlook|protection|google|aspmx|pphosted|mimecast|barracuda|secureserver|zoho"
+)
+_PROVIDER_MAP = {
+    "outlook": "microsoft365",
+    "protection": "microsoft365",
+    "google": "google",
+    "aspmx": "google",
+    "pphosted": "proofpoint",
+    "mimecast": "mimecast",
+    "barracuda": "barracuda",
+    "secureserver": "godaddy",
+    "zoho": "zoho",
+}
 
 def detect_mx_provider(mx_host:str)->str:
-    h = mx_host.lower()
-    if "outlook" in h or "protection" in h:  return "microsoft365"
-    if "google" in h or "aspmx" in h:        return "google"
-    if "pphosted" in h:                      return "proofpoint"
-    if "mimecast" in h:                      return "mimecast"
-    if "barracuda" in h:                     return "barracuda"
-    return "unknown"
+    m = _PROVIDER_RE.search(mx_host.lower())
+    return _PROVIDER_MAP[m.group(0)] if m else "unknown"
+
+def adaptive_pause(code, throttled:int=0) -> float:
+    """Pause to insert after an RCPT reply.
+
+    Definitive answers (250/550) need no pause; throttle replies
+    (421/450/451/452) back off exponentially; anything else gets the
+    small default."""
+    if code in (250, 550):
+        return 0.0
+    if code in (421, 450, 451, 452):
+        return min(THROTTLE_BACKOFF_BASE * (2 ** throttled), THROTTLE_BACKOFF_MAX)
+    return PAUSE_BETWEEN_PROBES
 
 def classify_email(local:str, domain:str):
     d = domain.lower()
     if d in FREE_PROVIDERS: return "free"
-    if any(d.endswith(dp) for dp in DISPOSABLE_PROVIDERS): return "disposable"
-    if d.endswith(".gov") or d.endswith(".gov.pk"): return "government"
-    if any(local.lower().startswith(p) for p in ROLE_PREFIXES): return "role"
+    if d.endswith(_DISPOSABLE_TUPLE): return "disposable"
+    if d.endswith((".gov", ".gov.pk")): return "government"
+    if local.lower().startswith(_ROLE_TUPLE): return "role"
     return "business"
 
 # =========================
-# SMTP MULTI-PROBE
+# MX RESOLUTION (TTL CACHE)
 # =========================
-def smtp_multi_probe(mx:str, target_email:str):
-    """Sends 3 probes → fake1, real, fake2 to detect catch-all & timing"""
-    domain = target_email.split("@")[1]
-    seq = [
-        f"{random_local()}@{domain}",
-        target_email,
-        f"{random_local()}@{domain}"
-    ]
-    results = []
-    try:
+_MX_CACHE: dict = {}          # domain -> (mx_records, provider, expiry_ts)
+_MX_CACHE_LOCK = threading.Lock()
+
+def _resolve_mx(domain:str):
+    """Resolves MX records for a domain, cached for the record's own TTL.
+
+    All candidate patterns for one find share a domain, so bulk runs collapse
+    to a single DNS round-trip. Returns (mx_records, provider).
+    """
+    d = domain.lower()
+    now = time.monotonic()
+    with _MX_CACHE_LOCK:
+        hit = _MX_CACHE.get(d)
+        if hit and hit[2] > now:
+            return hit[0], hit[1]
+
+    answers = dns.resolver.resolve(d, "MX")
+    # lowest preference value = primary MX; resolver order is arbitrary
+    mx_records = [str(r.exchange).rstrip('.') for r in sorted(answers, key=lambda r: r.preference)]
+    provider = detect_mx_provider(mx_records[0])
+    ttl = min(max(answers.rrset.ttl, MX_CACHE_TTL_MIN), MX_CACHE_TTL_MAX)
+
+    with _MX_CACHE_LOCK:
+        _MX_CACHE[d] = (mx_records, provider, now + ttl)
+    return mx_records, provider
+
+_ASYNC_RESOLVER = None
+
+def _async_resolver():
+    global _ASYNC_RESOLVER
+    if _ASYNC_RESOLVER is None:
+        _ASYNC_RESOLVER = aiodns.DNSResolver()
+    return _ASYNC_RESOLVER
+
+async def _resolve_mx_async(domain:str):
+    """Async twin of _resolve_mx — awaits aiodns instead of blocking the
+    event loop, sharing the same TTL cache."""
+    d = domain.lower()
+    now = time.monotonic()
+    with _MX_CACHE_LOCK:
+        hit = _MX_CACHE.get(d)
+        if hit and hit[2] > now:
+            return hit[0], hit[1]
+
+    answers = await _async_resolver().query(d, "MX")
+    mx_records = [a.host.rstrip('.') for a in sorted(answers, key=lambda a: a.priority)]
+    provider = detect_mx_provider(mx_records[0])
+    ttl = min(max(min(a.ttl for a in answers), MX_CACHE_TTL_MIN), MX_CACHE_TTL_MAX)
+
+    with _MX_CACHE_LOCK:
+        _MX_CACHE[d] = (mx_records, provider, now + ttl)
+    return mx_records, provider
+
+# =========================
+# PER-HOST CONNECTION CAP
+# =========================
+# how many simultaneous probes a provider's MX tolerates before 421ing
+_PROVIDER_CONN_LIMIT = {
+    "google": 4,
+    "microsoft365": 3,
+    "proofpoint": 1,
+    "mimecast": 2,
+    "barracuda": 2,
+}
+HOST_CONN_LIMIT_DEFAULT = 2
+
+_HOST_SEM: dict = {}          # mx host -> BoundedSemaphore
+_HOST_SEM_LOCK = threading.Lock()
+
+def _sem_for(host:str) -> threading.BoundedSemaphore:
+    with _HOST_SEM_LOCK:
+        sem = _HOST_SEM.get(host)
+        if sem is None:
+            limit = _PROVIDER_CONN_LIMIT.get(detect_mx_provider(host), HOST_CONN_LIMIT_DEFAULT)
+            sem = _HOST_SEM[host] = threading.BoundedSemaphore(limit)
+        return sem
+
+# =========================
+# SMTP SESSION (PERSISTENT)
+# =========================
+class SmtpSession:
+    """One open SMTP connection to an MX, reused across candidates.
+
+    Connect + HELO + MAIL FROM happen once; every candidate then costs a
+    single RCPT instead of a full connect/helo/mail/quit cycle. A dropped
+    or 421'd connection is re-established once, transparently.
+    """
+    def __init__(self, mx:str, port:int=25):
+        self.mx = mx
+        self.port = port
+        self.smtp = None
+        self.expiry = 0.0
+        self.pipelining = False
+        self.lock = threading.Lock()
+
+    def _connect(self):
+        self.close()
         s = smtplib.SMTP(timeout=TIMEOUT)
-        s.connect(mx)
-        s.helo("gmail.com")
+        s.connect(self.mx, self.port)
+        try:
+            s.ehlo("gmail.com")
+        except smtplib.SMTPHeloError:
+            s.helo("gmail.com")
+        self.pipelining = s.has_extn("pipelining")
         s.mail("verify@bounso.com")
+        self.smtp = s
+        self.expiry = time.monotonic() + SESSION_TTL
+        logging.debug("SMTP session opened to %s:%s pipelining=%s", self.mx, self.port, self.pipelining)
+
+    def _alive(self):
+        return self.smtp is not None and time.monotonic() < self.expiry
+
+    def _ensure(self):
+        if not self._alive():
+            self._connect()
+            return
+        try:
+            # fresh envelope for this probe group
+            self.smtp.rset()
+            self.smtp.mail("verify@bounso.com")
+        except (smtplib.SMTPException, OSError):
+            # connection died while idle within the TTL → reconnect
+            logging.debug("SMTP session to %s stale, reconnecting", self.mx)
+            self._connect()
+
+    def probe_many(self, addrs):
+        """Issues one RCPT per address on the shared session.
+        Returns [(addr, code, msg, latency_ms), ...]."""
+        with _sem_for(self.mx), self.lock:
+            self._ensure()
+            if self.pipelining and PIPELINING_NO_PAUSE:
+                return self._probe_pipelined(addrs)
+            return self._probe_serial(addrs)
+
+    def _probe_serial(self, addrs):
+        results = []
+        throttled = 0
+        for i, addr in enumerate(addrs):
+            if self.smtp is None:
+                # a 421 closed the channel on a previous probe → reconnect
+                try:
+                    self._connect()
+                except Exception:
+                    results.extend((a, None, "session_closed", None) for a in addrs[i:])
+                    break
+            start = time.perf_counter()
+            try:
+                code, msg = self.smtp.rcpt(addr)
+            except (smtplib.SMTPServerDisconnected, OSError):
+                # server dropped us mid-session → reconnect once
+                logging.debug("SMTP session to %s dropped, reconnecting", self.mx)
+                try:
+                    self._connect()
+                    code, msg = self.smtp.rcpt(addr)
+                except Exception as e:
+                    code, msg = None, str(e)
+            except Exception as e:
+                code, msg = None, str(e)
+            latency = round((time.perf_counter() - start) * 1000, 2)
+            msg = msg.decode() if isinstance(msg, bytes) else str(msg)
+            results.append((addr, code, msg, latency))
+            if code == 421:
+                # server is closing the channel; next probe reconnects
+                self.close()
+            pause = adaptive_pause(code, throttled)
+            throttled = throttled + 1 if code in (421, 450, 451, 452) else 0
+            if pause:
+                time.sleep(pause)
+        return results
 
-        for addr in seq:
+    def _probe_pipelined(self, addrs):
+        """RFC 2920: write every RCPT in one burst, then drain the replies
+        in order — N round-trips collapse into one."""
+        batch = b"".join(f"RCPT TO:<{a}>\r\n".encode("ascii") for a in addrs)
+        start = time.perf_counter()
+        try:
+            self.smtp.sock.sendall(batch)
+        except (smtplib.SMTPServerDisconnected, OSError):
+            logging.debug("SMTP session to %s dropped, reconnecting", self.mx)
+            self._connect()
+            if not self.pipelining:
+                return self._probe_serial(addrs)
+            self.smtp.sock.sendall(batch)
             start = time.perf_counter()
+        results = []
+        for i, addr in enumerate(addrs):
             try:
-                code, msg = s.rcpt(addr)
+                code, msg = self.smtp.getreply()
             except Exception as e:
                 code, msg = None, str(e)
             latency = round((time.perf_counter() - start) * 1000, 2)
             msg = msg.decode() if isinstance(msg, bytes) else str(msg)
             results.append((addr, code, msg, latency))
-            time.sleep(PAUSE_BETWEEN_PROBES)
+            if code == 421:
+                # server is closing the channel; the rest of the batch
+                # will never be answered
+                self.close()
+                results.extend((a, None, "session_closed", None) for a in addrs[i + 1:])
+                break
+        return results
+
+    def close(self):
+        if self.smtp is not None:
+            try:
+                self.smtp.quit()
+            except Exception:
+                pass
+            self.smtp = None
+        self.expiry = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        # cached sessions stay open for reuse; close() is explicit
+        return False
+
+
+_SESSIONS: dict = {}          # (mx, port) -> SmtpSession
+_SESSIONS_LOCK = threading.Lock()
+
+def _session_for(mx:str, port:int=25) -> SmtpSession:
+    key = (mx, port)
+    with _SESSIONS_LOCK:
+        # evict expired sessions so idle sockets for MXes we never revisit
+        # don't pile up; skip any session another thread is probing on
+        for other_key, other in list(_SESSIONS.items()):
+            if other_key == key or other._alive():
+                continue
+            if other.lock.acquire(blocking=False):
+                try:
+                    other.close()
+                finally:
+                    other.lock.release()
+                del _SESSIONS[other_key]
+
+        session = _SESSIONS.get(key)
+        if session is None:
+            session = _SESSIONS[key] = SmtpSession(mx, port)
+        return session
 
-        s.quit()
+# =========================
+# SMTP DOMAIN PROBE
+# =========================
+def smtp_verify_domain(mx:str, real_addrs):
+    """Catch-all check + one RCPT per candidate on a single session.
+
+    Catch-all only needs detecting once per domain, so two fake RCPTs go
+    first and every real address follows on the same session — N+2 probes
+    instead of 3 per candidate. Returns (catch_all, probes) where probes
+    maps addr -> (code, msg, latency_ms) in probe order (fakes first);
+    catch_all is None when the fakes got no definitive reply."""
+    domain = real_addrs[0].split("@")[1]
+    fakes = _fakes_for(domain)
+    try:
+        seq = _session_for(mx).probe_many(list(fakes) + list(real_addrs))
     except Exception as e:
-        results.append(("__connect__", None, f"connect_error:{e}", None))
-    return results
+        return None, {"__connect__": (None, f"connect_error:{e}", None)}
+
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("probe batch %s → %r", mx, seq)
+
+    probes = {addr: (code, msg, latency) for addr, code, msg, latency in seq}
+    fake1 = probes.get(fakes[0], (None, None, None))[0]
+    fake2 = probes.get(fakes[1], (None, None, None))[0]
+    if fake1 is None or fake2 is None:
+        catch_all = None
+    else:
+        catch_all = (fake1 == 250 and fake2 == 250)
+    return catch_all, probes
 
 # =========================
 # ANALYSIS
 # =========================
-def analyze_entropy_and_catchall(seq):
-    codes = [c for _, c, *_ in seq if c is not None]
-    msgs = [m[-80:] for *_, m, _ in seq if isinstance(m, str)]
-    latencies = [t for *_, t in seq if isinstance(t, (int, float))]
+def analyze_entropy_and_catchall(probes, catch_all, real_addr):
+    """Scores one candidate from a domain-level probe batch.
+
+    probes maps addr -> (code, msg, latency_ms); catch_all is the
+    domain-level verdict from the fake probes (None if inconclusive)."""
+    codes, msgs, latencies = [], [], []
+    for code, msg, latency in probes.values():
+        if code is not None:
+            codes.append(code)
+        if isinstance(msg, str):
+            msgs.append(msg[-80:])
+        if isinstance(latency, (int, float)):
+            latencies.append(latency)
     entropy = len(set(msgs))
     delta = int(max(latencies) - min(latencies)) if latencies else 0
 
-    if len(codes) < 3:
-        return {"entropy": entropy, "delta": delta, "is_catch_all": None, "real_code": None, "avg_latency": None}
+    real_code = probes.get(real_addr, (None, None, None))[0]
 
-    fake1, real, fake2 = codes[0], codes[1], codes[2]
-    catch_all = (fake1 == 250 and fake2 == 250)
-    flat_entropy = (entropy == 1)
-    is_catch_all = catch_all or (flat_entropy and real == 250)
+    is_catch_all = catch_all
+    if is_catch_all is None and codes:
+        # fakes were inconclusive; flat replies + acceptance still smells catch-all
+        is_catch_all = (entropy == 1 and real_code == 250) or None
 
     return {
         "entropy": entropy,
         "delta": delta,
         "is_catch_all": is_catch_all,
-        "real_code": real,
-        "avg_latency": int(mean(latencies)) if latencies else None
+        "real_code": real_code,
+        "avg_latency": int(sum(latencies) / len(latencies)) if latencies else None
     }
 
+# =========================
+# RESULT CACHE (LRU + TTL)
+# =========================
+_RESULT_CACHE: OrderedDict = OrderedDict()   # email -> (result, expiry_ts)
+_RESULT_CACHE_LOCK = threading.Lock()
+
+def _cached_result(email:str):
+    """Returns a deep copy of a fresh cached result, or None."""
+    key = email.lower()
+    now = time.monotonic()
+    with _RESULT_CACHE_LOCK:
+        hit = _RESULT_CACHE.get(key)
+        if hit is None:
+            return None
+        result, expiry = hit
+        if expiry <= now:
+            del _RESULT_CACHE[key]
+            return None
+        _RESULT_CACHE.move_to_end(key)
+        return copy.deepcopy(result)
+
+def _store_result(email:str, result):
+    key = email.lower()
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE[key] = (copy.deepcopy(result), time.monotonic() + RESULT_CACHE_TTL)
+        _RESULT_CACHE.move_to_end(key)
+        while len(_RESULT_CACHE) > RESULT_CACHE_MAX:
+            _RESULT_CACHE.popitem(last=False)
+
 # =========================
 # MAIN VERIFY FUNCTION
 # =========================
-def verify_email(email:str):
-    result = {
+def _new_result(email:str):
+    return {
         "email": email,
         "status": "undeliverable",
         "deliverable": False,
@@ -118,38 +439,199 @@ def verify_email(email:str):
         "details": {}
     }
 
+def _precheck(result, email:str):
+    """Syntax + classification steps shared by sync/async verify.
+    Returns the domain, or None if the result is already final."""
+    if not EMAIL_REGEX.match(email or ""):
+        result["details"]["reasoning"] = "bad_syntax"
+        return None
+
+    local, domain = email.split("@", 1)
+    email_type = classify_email(local, domain)
+    result["details"]["email_type"] = email_type
+
+    if email_type == "disposable":
+        # no point probing mailinator et al. — synthesize the verdict
+        result["details"]["reasoning"] = "disposable_domain"
+        return None
+
+    return domain
+
+def _score(result, probes, catch_all, email:str):
+    analysis = analyze_entropy_and_catchall(probes, catch_all, email)
+
+    result["smtp"]["seq"] = [(a,) + tuple(v) for a, v in probes.items()]
+    result["smtp"]["analysis"] = analysis
+
+    code = analysis.get("real_code")
+    if code == 250:
+        result["status"] = "deliverable"
+        result["deliverable"] = True
+        result["verification_score"] = 0.98 if not analysis.get("is_catch_all") else 0.85
+    elif code == 550:
+        result["status"] = "undeliverable"
+    else:
+        result["status"] = "unknown"
+
+    result["details"]["is_catch_all"] = analysis.get("is_catch_all")
+    result["details"]["reasoning"] = f"smtp_code={code}"
+
+    return result
+
+def _probe_and_score(result, email:str, mx_records):
+    catch_all, probes = smtp_verify_domain(mx_records[0], [email])
+    return _score(result, probes, catch_all, email)
+
+def verify_email(email:str):
+    cached = _cached_result(email or "")
+    if cached is not None:
+        return cached
+
+    result = _new_result(email)
+
     try:
-        if not EMAIL_REGEX.match(email or ""):
-            result["details"]["reasoning"] = "bad_syntax"
+        domain = _precheck(result, email)
+        if domain is None:
             return result
 
-        local, domain = email.split("@", 1)
-        email_type = classify_email(local, domain)
-        result["details"]["email_type"] = email_type
+        # MX lookup (cached per domain)
+        mx_records, provider = _resolve_mx(domain)
+        result["mx_provider"] = provider
+
+        result = _probe_and_score(result, email, mx_records)
+        if result["smtp"]["analysis"].get("real_code") is not None:
+            _store_result(email, result)
+        return result
+
+    except Exception as e:
+        result["details"]["reasoning"] = f"error:{e}"
+        return result
+
+def verify_domain_candidates(domain:str, candidates):
+    """Verifies every candidate for one domain with a single probe batch.
+
+    Cached candidates are answered from the result cache; the rest share
+    one smtp_verify_domain call (2 fake RCPTs + 1 per candidate) and one
+    MX lookup. Returns results in candidate order, each shaped like
+    verify_email's."""
+    cached = {}
+    prepped = {}
+    final = set()
+    pending = []
+    for email in candidates:
+        hit = _cached_result(email)
+        if hit is not None:
+            cached[email] = hit
+            continue
+        result = _new_result(email)
+        prepped[email] = result
+        if _precheck(result, email) is None:
+            final.add(email)      # bad syntax / disposable — never probed
+        else:
+            pending.append(email)
+
+    catch_all, probes, provider, probe_error = None, {}, "unknown", None
+    if pending:
+        try:
+            mx_records, provider = _resolve_mx(domain)
+            catch_all, probes = smtp_verify_domain(mx_records[0], pending)
+        except Exception as e:
+            probe_error = f"error:{e}"
+    fake_items = list(probes.items())[:2]
+
+    out = []
+    for email in candidates:
+        if email in cached:
+            out.append(cached[email])
+            continue
 
-        # MX lookup
-        mx_records = [str(r.exchange).rstrip('.') for r in dns.resolver.resolve(domain, "MX")]
-        result["mx_provider"] = detect_mx_provider(mx_records[0])
+        result = prepped[email]
+        if email in final:
+            out.append(result)
+            continue
+        if probe_error is not None:
+            result["details"]["reasoning"] = probe_error
+            out.append(result)
+            continue
 
-        seq = smtp_multi_probe(mx_records[0], email)
-        analysis = analyze_entropy_and_catchall(seq)
+        result["mx_provider"] = provider
+        own = dict(fake_items)
+        own[email] = probes.get(email, (None, "no_reply", None))
+        result = _score(result, own, catch_all, email)
+        if result["smtp"]["analysis"].get("real_code") is not None:
+            _store_result(email, result)
+        out.append(result)
+    return out
 
-        result["smtp"]["seq"] = seq
-        result["smtp"]["analysis"] = analysis
+# =========================
+# CONCURRENT VERIFICATION
+# =========================
+def verify_candidates(emails, max_workers:int=MAX_WORKERS_DEFAULT):
+    """Verifies candidates concurrently and returns the first deliverable
+    non-catch-all result (or None). Outstanding futures are cancelled the
+    moment a winner is found so the MX isn't probed after the answer is
+    known."""
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [executor.submit(verify_email, e) for e in emails]
+        for f in as_completed(futures):
+            res = f.result()
+            if res["deliverable"] and not res["details"].get("is_catch_all"):
+                return res
+        return None
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def verify_bulk_emails(emails, max_workers:int=MAX_WORKERS_DEFAULT):
+    """Verifies a batch of emails concurrently.
 
-        code = analysis.get("real_code")
-        if code == 250:
-            result["status"] = "deliverable"
-            result["deliverable"] = True
-            result["verification_score"] = 0.98 if not analysis.get("is_catch_all") else 0.85
-        elif code == 550:
-            result["status"] = "undeliverable"
+    Results come back in input order: the list is preallocated and each
+    future scatters into its original index, so callers can zip against
+    their input without re-sorting. Cached entries never hit the pool."""
+    results = [None] * len(emails)
+    uncached = []
+    for i, e in enumerate(emails):
+        hit = _cached_result(e)
+        if hit is not None:
+            results[i] = hit
         else:
-            result["status"] = "unknown"
+            uncached.append((i, e))
+
+    if uncached:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(verify_email, e): i for i, e in uncached}
+            for f in as_completed(futures):
+                results[futures[f]] = f.result()
+    return results
+
+_ASYNC_SEM = None
+
+async def verify_email_async(email:str):
+    """verify_email for the event loop: MX resolution awaits aiodns and
+    the SMTP probe runs in a worker thread, so concurrent requests
+    overlap instead of serializing behind blocking I/O."""
+    global _ASYNC_SEM
+    if _ASYNC_SEM is None:
+        _ASYNC_SEM = asyncio.Semaphore(MAX_WORKERS_DEFAULT)
+
+    cached = _cached_result(email or "")
+    if cached is not None:
+        return cached
+
+    result = _new_result(email)
+
+    try:
+        domain = _precheck(result, email)
+        if domain is None:
+            return result
 
-        result["details"]["is_catch_all"] = analysis.get("is_catch_all")
-        result["details"]["reasoning"] = f"smtp_code={code}"
+        mx_records, provider = await _resolve_mx_async(domain)
+        result["mx_provider"] = provider
 
+        async with _ASYNC_SEM:
+            result = await asyncio.to_thread(_probe_and_score, result, email, mx_records)
+        if result["smtp"]["analysis"].get("real_code") is not None:
+            _store_result(email, result)
         return result
 
     except Exception as e: